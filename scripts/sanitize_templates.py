@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""Sanitize exported Framer HTML before publishing.
+
+Strips Framer branding and telemetry, rewrites page metadata to match the
+portfolio content in case-studies/, localises vendor-hosted assets (favicons,
+OG/Twitter images) so published pages don't depend on framerusercontent.com,
+and renames Framer-specific data attributes.
+
+Usage:
+    python3 scripts/sanitize_templates.py [--config PATH] [--dry-run]
+                                          [--verbose] [--parser lexbor|lxml]
+                                          [--jobs N]
+
+Parsing uses selectolax's Lexbor engine by default; pass --parser lxml to
+use lxml.html (requires cssselect) instead.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import functools
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "sanitize-config.json"
+
+# A bare tag name needs no CSS engine on the lxml backend; tree.iter is a
+# direct C traversal.
+_TAG_ONLY_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9]*\Z")
+
+
+@functools.lru_cache(maxsize=256)
+def _css_expression(selector):
+    """Compiled cssselect expression; lxml's cssselect() re-translates the
+    selector to XPath on every call otherwise."""
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(selector)
+
+
+_FRAMER_BADGE_CSS_RE = re.compile(
+    r"@supports\s*\(z-index:calc\(infinity\)\)\s*"
+    r"\{#__framer-badge-container\{[^}]+\}\}"
+    r"#__framer-badge-container\{[^}]+\}"
+)
+
+
+def _translate_glob(pattern):
+    """Translate a glob pattern to a regex fragment with path semantics:
+    unlike fnmatch.translate, * and ? do not cross '/'."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            # Like fnmatch: an immediate ! negates, and a ] right after the
+            # (possibly negated) opening bracket is a literal member.
+            j = i + 1
+            if j < len(pattern) and pattern[j] == "!":
+                j += 1
+            if j < len(pattern) and pattern[j] == "]":
+                j += 1
+            end = pattern.find("]", j)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                inner = pattern[i + 1:end]
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                elif inner.startswith("^"):
+                    inner = "\\" + inner
+                out.append(f"[{inner}]")
+                i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def _copy_file(src, dst):
+    """Copy src to dst kernel-side where available (Linux >= 4.5; CoW on
+    filesystems that support it), falling back to shutil.copy2. Metadata is
+    preserved either way so backup_file can skip identical re-copies."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                                remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # cross-device or unsupported filesystem
+    shutil.copy2(src, dst)
+
+
+@functools.lru_cache(maxsize=1024)
+def _relative_path(from_dir, to_file):
+    """Cached os.path.relpath; files in the same directory keep asking for
+    the same (from_dir, to_file) pairs."""
+    return os.path.relpath(to_file, from_dir)
+
+
+@functools.lru_cache(maxsize=4096)
+def _vendor_decision(url, vendor_domains):
+    """Cached (should_download, netloc) for a URL; templates repeat the same
+    vendor URLs many times per run."""
+    if not url or not url.startswith(("http://", "https://")):
+        return False, ""
+    netloc = urlparse(url).netloc.lower()
+    for domain in vendor_domains:
+        if netloc == domain or netloc.endswith("." + domain):
+            return True, netloc
+    return False, netloc
+
+
+class LexborElement:
+    """Wraps a selectolax LexborNode behind the element interface."""
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def attrs(self):
+        return self._node.attributes
+
+    def get(self, name):
+        return self._node.attributes.get(name)
+
+    def set(self, name, value):
+        self._node.attrs[name] = value
+
+    def remove_attr(self, name):
+        del self._node.attrs[name]
+
+    def text(self):
+        return self._node.text()
+
+    def set_text(self, value):
+        # Lexbor has no direct text setter; replace the node's children.
+        self._node.html  # force materialisation before mutation
+        for child in self._node.iter(include_text=True):
+            child.decompose()
+        self._node.insert_child(value)
+
+    def decompose(self):
+        self._node.decompose()
+
+
+class LexborDocument:
+    """Thin adapter around selectolax.lexbor.LexborHTMLParser."""
+
+    def __init__(self, content):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._tree = LexborHTMLParser(content)
+
+    def select(self, selector):
+        return [LexborElement(node) for node in self._tree.css(selector)]
+
+    def select_one(self, selector):
+        node = self._tree.css_first(selector)
+        return LexborElement(node) if node is not None else None
+
+    def serialize(self):
+        return self._tree.html
+
+
+class LxmlElement:
+    """Wraps an lxml element behind the element interface."""
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def attrs(self):
+        return self._element.attrib
+
+    def get(self, name):
+        return self._element.get(name)
+
+    def set(self, name, value):
+        self._element.set(name, value)
+
+    def remove_attr(self, name):
+        del self._element.attrib[name]
+
+    def text(self):
+        return self._element.text_content()
+
+    def set_text(self, value):
+        for child in list(self._element):
+            self._element.remove(child)
+        self._element.text = value
+
+    def decompose(self):
+        parent = self._element.getparent()
+        if parent is not None:
+            parent.remove(self._element)
+
+
+class LxmlDocument:
+    """lxml.html backend: C-level attribute mutation and serialization."""
+
+    def __init__(self, content):
+        from lxml import html
+
+        self._html = html
+        self._tree = html.fromstring(content)
+
+    def select(self, selector):
+        if _TAG_ONLY_RE.match(selector):
+            return [LxmlElement(el) for el in self._tree.iter(selector)]
+        return [LxmlElement(el) for el in _css_expression(selector)(self._tree)]
+
+    def select_one(self, selector):
+        if _TAG_ONLY_RE.match(selector):
+            first = next(self._tree.iter(selector), None)
+            return LxmlElement(first) if first is not None else None
+        matches = _css_expression(selector)(self._tree)
+        return LxmlElement(matches[0]) if matches else None
+
+    def serialize(self):
+        return self._html.tostring(self._tree.getroottree(),
+                                   encoding="unicode", method="html")
+
+
+class TemplateSanitizer:
+    def __init__(self, config_path=DEFAULT_CONFIG_PATH, dry_run=False,
+                 parser="lexbor", jobs=None):
+        with open(config_path, encoding="utf-8") as f:
+            self.config = json.load(f)
+        self.config_path = config_path
+        self.dry_run = dry_run
+        self.parser = parser
+        self.jobs = jobs or os.cpu_count() or 1
+        self.report = []
+        self.processed_files = 0
+        self.downloaded_assets = []
+        self.asset_jobs = {}      # url -> local Path, downloaded in one batch
+        self.asset_rewrites = []  # (file_path, url, relative href)
+        self._page_text_cache = {}  # path str -> (title, description)
+        # Workers print nothing but may still need to collect lines for the
+        # parent (verbose run with no report file); see _init_worker.
+        self._collect_logs = False
+        # Compile removal/replacement specs once; they are reused per file.
+        self._remove_specs = [
+            (cfg["selector"],
+             re.compile(cfg["contains"], re.IGNORECASE) if cfg.get("contains") else None)
+            for cfg in self.config["remove_elements"]
+        ]
+        self._attr_replacements = tuple(
+            (cfg["from"], cfg["to"]) for cfg in self.config["attribute_replacements"]
+        )
+        self._attr_map = dict(self._attr_replacements)
+        # One selector union so the rewrite pass walks the tree once, not
+        # once per replaced attribute.
+        self._attr_selector = ",".join(
+            f"[{from_attr}]" for from_attr, _ in self._attr_replacements
+        )
+        self._vendor_domains = tuple(
+            domain.lower() for domain in self.config["vendor_domains"]
+        )
+        self._assets_dir = Path(self.config["assets"]["local_path"]).resolve()
+        # Glob patterns are translated once; Path.match would re-parse the
+        # pattern for every file it filters. Includes anchor to the root
+        # (like root.glob(pattern) did); excludes anchor to any component
+        # boundary (like Path.match's right-anchored matching).
+        self._include_re = re.compile(
+            "(?:" + "|".join(f"(?:{_translate_glob(p)})"
+                             for p in self.config["files"]["patterns"]) + r")\Z"
+        )
+        excludes = self.config["files"]["exclude"]
+        self._exclude_re = re.compile(
+            "|".join(f"(?:^|/)(?:{_translate_glob(p)})\\Z" for p in excludes)
+        ) if excludes else None
+        # Cheap literal probe run before parsing: a file with none of these
+        # tokens (typically one that was already sanitized) needs no DOM work.
+        generic = {"div", "span", "meta", "script", "link", "name", "rel",
+                   "href", "property", "content", "class"}
+        tokens = set(self._vendor_domains)
+        tokens.update(from_attr for from_attr, _ in self._attr_replacements)
+        for cfg in self.config["remove_elements"]:
+            source = cfg.get("contains") or cfg["selector"]
+            tokens.update(t for t in re.findall(r"[\w-]{4,}", source)
+                          if t not in generic)
+        self._fast_probe = re.compile(
+            "|".join(re.escape(t) for t in sorted(tokens))
+        )
+
+    def log(self, message, level="INFO"):
+        output = self.config["output"]
+        if not (output["verbose"] or output["report"] or self._collect_logs):
+            return
+        # Formatting is deferred to generate_report; quiet runs with no
+        # report file skip the append entirely.
+        self.report.append((level, message))
+        if output["verbose"]:
+            print(f"[{level}] {message}")
+
+    def parse(self, content):
+        if self.parser == "lxml":
+            return LxmlDocument(content)
+        return LexborDocument(content)
+
+    def find_html_files(self):
+        root = Path(self.config["files"]["root"])
+        files = set()
+        for file_path in root.rglob("*.html"):
+            relative = str(file_path.relative_to(root))
+            if not self._include_re.match(relative):
+                continue
+            if self._exclude_re and self._exclude_re.search(relative):
+                continue
+            files.add(file_path)
+        return sorted(files)
+
+    def backup_file(self, file_path):
+        root = Path(self.config["files"]["root"])
+        backup_dir = root / self.config["output"]["backup_dir"]
+        backup_path = backup_dir / file_path.relative_to(root)
+        src_stat = file_path.stat()
+        try:
+            dst_stat = backup_path.stat()
+            if (dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime == src_stat.st_mtime):
+                return  # unchanged since the previous run's backup
+        except FileNotFoundError:
+            pass
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        _copy_file(file_path, backup_path)
+        self.log(f"Backed up {file_path} -> {backup_path}")
+
+    @staticmethod
+    def _classify(file_path):
+        path_str = str(file_path).lower()
+        if "work/" in path_str or "blog/" in path_str:
+            return "work"
+        if "about" in path_str:
+            return "about"
+        return "default"
+
+    def _page_text(self, file_path):
+        """Cached (title, description) for a file; the classification and
+        formatting only ever need to run once per path."""
+        key = str(file_path)
+        cached = self._page_text_cache.get(key)
+        if cached is not None:
+            return cached
+        kind = self._classify(file_path)
+        titles = self.config["metadata"]["titles"]
+        descriptions = self.config["metadata"]["descriptions"]
+        if kind == "work":
+            page = file_path.stem.replace("-", " ").title()
+            value = (titles["work"].format(page=page),
+                     descriptions["work"].format(page=page))
+        else:
+            value = (titles[kind], descriptions[kind])
+        self._page_text_cache[key] = value
+        return value
+
+    def sanitize_css(self, content):
+        """Strip the Framer badge rules injected into inline stylesheets."""
+        new_content, count = _FRAMER_BADGE_CSS_RE.subn("", content)
+        if count:
+            self.log("Removed Framer badge CSS")
+            return new_content, 1
+        return content, 0
+
+    @staticmethod
+    def _index_metas(doc):
+        """One sweep over the meta tags, bucketed by name/property so later
+        lookups don't each walk the tree from the root."""
+        index = {}
+        for element in doc.select("meta"):
+            for key_attr in ("name", "property"):
+                key = element.get(key_attr)
+                if key and key not in index:
+                    index[key] = element
+        return index
+
+    @staticmethod
+    def _set_meta(meta_index, key, value):
+        element = meta_index.get(key)
+        if element is not None and element.get("content") != value:
+            element.set("content", value)
+            return 1
+        return 0
+
+    def sanitize_metadata(self, doc, file_path, meta_index):
+        changes = 0
+        for selector, pat in self._remove_specs:
+            for element in doc.select(selector):
+                if pat:
+                    # Text usually decides the match; only stringify the
+                    # attributes when it doesn't.
+                    if not pat.search(element.text()) and not any(
+                        pat.search(str(v)) for v in element.attrs.values()
+                    ):
+                        continue
+                element.decompose()
+                changes += 1
+                self.log(f"Removed element matching {selector}")
+
+        title, description = self._page_text(file_path)
+        title_tag = doc.select_one("title")
+        if title_tag and title_tag.text() != title:
+            title_tag.set_text(title)
+            changes += 1
+
+        changes += self._set_meta(meta_index, "description", description)
+        changes += self._set_meta(meta_index, "og:title", title)
+        changes += self._set_meta(meta_index, "og:description", description)
+        changes += self._set_meta(meta_index, "twitter:title", title)
+        changes += self._set_meta(meta_index, "twitter:description", description)
+        return changes
+
+    def should_download_asset(self, url):
+        return _vendor_decision(url, self._vendor_domains)[0]
+
+    # relpath can only raise ValueError on Windows (cross-drive paths), so
+    # the cross-drive check is picked at class-definition time instead of an
+    # exception handler sitting on the per-asset hot path.
+    if os.name == "nt":
+        def get_relative_path(self, from_file, to_file):
+            if (os.path.splitdrive(str(from_file))[0].lower()
+                    != os.path.splitdrive(str(to_file))[0].lower()):
+                return str(to_file)
+            return _relative_path(str(from_file.parent), str(to_file))
+    else:
+        def get_relative_path(self, from_file, to_file):
+            return _relative_path(str(from_file.parent), str(to_file))
+
+    def sanitize_assets(self, doc, file_path, meta_index):
+        """Queue vendor-hosted assets for download; hrefs are rewritten in a
+        second pass once the batch download has completed."""
+        if not self.config["assets"]["download"]:
+            return 0
+        candidates = []
+        for selector in ('link[rel="icon"]', 'link[rel="apple-touch-icon"]'):
+            candidates.extend((element, "href") for element in doc.select(selector))
+        for key in ("og:image", "twitter:image"):
+            element = meta_index.get(key)
+            if element is not None:
+                candidates.append((element, "content"))
+        for element, attr in candidates:
+            url = element.get(attr)
+            if not self.should_download_asset(url):
+                continue
+            filename = Path(urlparse(url).path).name
+            if not filename:
+                continue
+            local_path = self._assets_dir / filename
+            self.asset_jobs[url] = local_path
+            self.asset_rewrites.append(
+                (file_path,
+                 url,
+                 self.get_relative_path(file_path.resolve(), local_path))
+            )
+            self.log(f"Queued {url} -> {local_path}")
+        return 0
+
+    def download_assets(self):
+        """Download all queued assets concurrently, then rewrite hrefs."""
+        if not self.asset_jobs:
+            return
+        if self.dry_run:
+            for url, local_path in self.asset_jobs.items():
+                self.log(f"Would download {url} -> {local_path}")
+            return
+        # asset_jobs is url -> local path, so each URL is fetched at most
+        # once per run; anything already on disk from a previous run is
+        # reused outright.
+        downloaded = set()
+        pending = {}
+        for url, local_path in self.asset_jobs.items():
+            if local_path.exists():
+                downloaded.add(url)
+                self.log(f"Reusing existing {local_path} for {url}")
+            else:
+                pending[url] = local_path
+        if pending:
+            results = asyncio.run(_download_all(pending))
+            for url, local_path, error in results:
+                if error:
+                    self.log(f"Failed to download {url}: {error}", level="ERROR")
+                else:
+                    downloaded.add(url)
+                    self.downloaded_assets.append(local_path)
+                    self.log(f"Downloaded {url} -> {local_path}")
+        rewrites_by_file = {}
+        for file_path, url, relative_href in self.asset_rewrites:
+            if url in downloaded:
+                rewrites_by_file.setdefault(file_path, []).append((url, relative_href))
+        for file_path, pairs in rewrites_by_file.items():
+            content = file_path.read_text(encoding="utf-8")
+            new_content = content
+            for url, relative_href in pairs:
+                new_content = new_content.replace(url, relative_href)
+            if new_content != content:
+                file_path.write_text(new_content, encoding="utf-8")
+                self.log(f"{file_path}: rewrote {len(pairs)} asset references")
+
+    def sanitize_attributes(self, doc):
+        changes = 0
+        if not self._attr_selector:
+            return changes
+        for element in doc.select(self._attr_selector):
+            for from_attr in [a for a in element.attrs if a in self._attr_map]:
+                element.set(self._attr_map[from_attr], element.get(from_attr))
+                element.remove_attr(from_attr)
+                changes += 1
+        return changes
+
+    @staticmethod
+    def _atomic_write(file_path, data):
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, file_path)
+
+    def process_file(self, file_path):
+        original = file_path.read_bytes()
+        content, css_changes = self.sanitize_css(original.decode("utf-8"))
+        if css_changes == 0 and not self._fast_probe.search(content):
+            self.log(f"{file_path}: no vendor markers, skipped")
+            return 0
+        doc = self.parse(content)
+        meta_index = self._index_metas(doc)
+        total_changes = css_changes
+        total_changes += self.sanitize_metadata(doc, file_path, meta_index)
+        total_changes += self.sanitize_assets(doc, file_path, meta_index)
+        total_changes += self.sanitize_attributes(doc)
+        if total_changes and not self.dry_run:
+            new_bytes = doc.serialize().encode("utf-8")
+            if new_bytes != original:
+                self._atomic_write(file_path, new_bytes)
+            else:
+                self.log(f"{file_path}: serialization unchanged, write skipped")
+        self.log(f"{file_path}: {total_changes} changes")
+        return total_changes
+
+    def generate_report(self):
+        report_path = self.config["output"]["report"]
+        if not report_path or self.dry_run:
+            return
+        # A bare filename lands next to the export, not in whatever
+        # directory the tool happened to be run from.
+        report_path = Path(report_path)
+        if not report_path.is_absolute():
+            report_path = Path(self.config["files"]["root"]) / report_path
+        lines = [f"[{level}] {message}" for level, message in self.report]
+        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def _check_dependencies(self):
+        """Fail before any backup or rewrite starts if a runtime dependency
+        is missing; the imports themselves stay deferred to first use."""
+        missing = []
+        try:
+            if self.parser == "lxml":
+                import lxml.cssselect  # noqa: F401
+            else:
+                import selectolax.lexbor  # noqa: F401
+        except ImportError:
+            missing.append("lxml + cssselect" if self.parser == "lxml"
+                           else "selectolax")
+        if self.config["assets"]["download"] and not self.dry_run:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError:
+                missing.append("aiohttp")
+        if missing:
+            raise SystemExit(
+                "Missing dependencies: " + ", ".join(missing)
+                + ". Install them with: pip install -r scripts/requirements.txt"
+            )
+
+    def run(self):
+        self._check_dependencies()
+        html_files = self.find_html_files()
+        self.log(f"Found {len(html_files)} HTML files")
+        # Each file is parsed and rewritten independently, so fan out across
+        # cores; --dry-run stays single-process so the log reads in order.
+        if self.jobs > 1 and not self.dry_run and len(html_files) > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(self.config_path, self.dry_run, self.parser,
+                          bool(self.config["output"]["verbose"]
+                               or self.config["output"]["report"])),
+            ) as executor:
+                results = executor.map(_process_one, html_files, chunksize=4)
+                for _changes, log_lines, asset_jobs, asset_rewrites in results:
+                    self.report.extend(log_lines)
+                    if self.config["output"]["verbose"]:
+                        for level, message in log_lines:
+                            print(f"[{level}] {message}")
+                    self.asset_jobs.update(asset_jobs)
+                    self.asset_rewrites.extend(asset_rewrites)
+                    self.processed_files += 1
+        else:
+            for file_path in html_files:
+                if not self.dry_run:
+                    self.backup_file(file_path)
+                self.process_file(file_path)
+                self.processed_files += 1
+        self.download_assets()
+        self.log(
+            f"Processed {self.processed_files} files, "
+            f"downloaded {len(self.downloaded_assets)} assets"
+        )
+        self.generate_report()
+
+
+async def _download_all(jobs, limit=16):
+    """Fetch url -> local_path jobs concurrently with a bounded semaphore.
+
+    Returns a list of (url, local_path, error) tuples; error is None on
+    success.
+    """
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def fetch(session, url, local_path):
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    data = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+                return url, local_path, str(exc) or "timed out"
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path.write_bytes(data)
+        return url, local_path, None
+
+    # One pooled session for the whole batch: connections to the same CDN
+    # host are kept alive and reused instead of paying TCP+TLS setup per
+    # asset.
+    connector = aiohttp.TCPConnector(use_dns_cache=True, ttl_dns_cache=300,
+                                     limit_per_host=8, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=60, sock_connect=10)
+    async with aiohttp.ClientSession(connector=connector,
+                                     timeout=timeout) as session:
+        tasks = [fetch(session, url, local_path)
+                 for url, local_path in jobs.items()]
+        return await asyncio.gather(*tasks)
+
+
+# Per-process sanitizer for ProcessPoolExecutor workers; built once per
+# worker by _init_worker so config parsing isn't repeated per file.
+_worker = None
+
+
+def _init_worker(config_path, dry_run, parser, collect_logs):
+    global _worker
+    _worker = TemplateSanitizer(config_path=config_path, dry_run=dry_run,
+                                parser=parser)
+    # The parent prints collected log lines; keep workers quiet to avoid
+    # interleaved output.
+    _worker.config["output"]["verbose"] = False
+    _worker._collect_logs = collect_logs
+
+
+def _process_one(file_path):
+    _worker.report = []
+    _worker.asset_jobs = {}
+    _worker.asset_rewrites = []
+    if not _worker.dry_run:
+        _worker.backup_file(file_path)
+    changes = _worker.process_file(file_path)
+    return changes, _worker.report, _worker.asset_jobs, _worker.asset_rewrites
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG_PATH,
+                        help="path to sanitize-config.json")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report changes without writing files")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print log lines as they happen")
+    parser.add_argument("--parser", choices=("lexbor", "lxml"),
+                        default="lexbor",
+                        help="HTML backend (default: lexbor)")
+    parser.add_argument("--jobs", type=int, default=None, metavar="N",
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    sanitizer = TemplateSanitizer(config_path=args.config, dry_run=args.dry_run,
+                                  parser=args.parser, jobs=args.jobs)
+    if args.verbose:
+        sanitizer.config["output"]["verbose"] = True
+    sanitizer.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
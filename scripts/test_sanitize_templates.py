@@ -0,0 +1,173 @@
+"""End-to-end tests for sanitize_templates.py.
+
+Runs the sanitizer over a small Framer-like export and checks the
+behaviors the tool exists for: badge/telemetry removal, metadata
+rewrites, attribute renames, asset localisation, backup handling, and
+idempotent re-runs. Each case runs against every parser backend whose
+dependencies are installed.
+
+Run with:
+    python3 -m unittest discover -s scripts
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from sanitize_templates import DEFAULT_CONFIG_PATH, TemplateSanitizer
+
+FIXTURE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Framer Site</title>
+<meta name="generator" content="Framer 2024">
+<meta name="description" content="placeholder">
+<meta property="og:title" content="placeholder">
+<meta property="og:description" content="placeholder">
+<meta name="twitter:title" content="placeholder">
+<meta name="twitter:description" content="placeholder">
+<link rel="icon" href="https://framerusercontent.com/images/favicon.png">
+<style>@supports (z-index:calc(infinity)) \
+{#__framer-badge-container{position:fixed;bottom:0}}\
+#__framer-badge-container{z-index:9}</style>
+</head>
+<body>
+<div id="__framer-badge-container"><div class="framer-badge">Made in Framer</div></div>
+<div data-framer-name="Hero" data-framer-page-optimized-at="t0">Intro copy</div>
+</body>
+</html>
+"""
+
+
+def _available_backends():
+    backends = []
+    try:
+        import selectolax.lexbor  # noqa: F401
+        backends.append("lexbor")
+    except ImportError:
+        pass
+    try:
+        import lxml.cssselect  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+class SanitizeEndToEnd(unittest.TestCase):
+
+    def _make_export(self, tmp):
+        root = Path(tmp) / "export"
+        root.mkdir()
+        (root / "index.html").write_text(FIXTURE, encoding="utf-8")
+        assets_dir = root / "images" / "site"
+        assets_dir.mkdir(parents=True)
+        # Pre-seed the favicon so localisation needs no network access.
+        (assets_dir / "favicon.png").write_bytes(b"\x89PNG fake")
+        config = json.loads(DEFAULT_CONFIG_PATH.read_text(encoding="utf-8"))
+        config["files"]["root"] = str(root)
+        config["assets"]["local_path"] = str(assets_dir)
+        config["output"]["report"] = ""
+        config_path = Path(tmp) / "config.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        return root, config_path
+
+    def test_full_run(self):
+        for backend in _available_backends():
+            with self.subTest(parser=backend), \
+                    tempfile.TemporaryDirectory() as tmp:
+                root, config_path = self._make_export(tmp)
+                page = root / "index.html"
+
+                TemplateSanitizer(config_path=config_path, parser=backend,
+                                  jobs=1).run()
+                result = page.read_text(encoding="utf-8")
+
+                # Badge CSS, badge markup, and generator meta are removed.
+                self.assertNotIn("__framer-badge", result)
+                self.assertNotIn("Made in Framer", result)
+                self.assertNotIn("generator", result)
+
+                # Metadata is rewritten from the configured page text.
+                self.assertIn("<title>Matt Lelonek — UX Designer</title>",
+                              result)
+                self.assertNotIn("placeholder", result)
+                self.assertIn("UX designer using research", result)
+
+                # Framer attributes are renamed, values preserved.
+                self.assertNotIn("data-framer-name", result)
+                self.assertIn('data-name="Hero"', result)
+                self.assertIn('data-optimized-at="t0"', result)
+
+                # The favicon points at the local asset, not the CDN.
+                self.assertNotIn("framerusercontent.com", result)
+                self.assertIn('href="images/site/favicon.png"', result)
+
+                # The backup preserves the original and is never re-scanned.
+                backup = root / "backup" / "index.html"
+                self.assertEqual(backup.read_text(encoding="utf-8"), FIXTURE)
+                fresh = TemplateSanitizer(config_path=config_path,
+                                          parser=backend, jobs=1)
+                self.assertEqual(fresh.find_html_files(), [page])
+
+                # A second run changes nothing; the backup now snapshots the
+                # pre-run (already sanitized) state.
+                fresh.run()
+                self.assertEqual(page.read_text(encoding="utf-8"), result)
+                self.assertEqual(backup.read_text(encoding="utf-8"), result)
+
+    def test_include_patterns_fully_anchored(self):
+        # Every include alternative must full-match, not prefix-match.
+        include_re = TemplateSanitizer()._include_re
+        self.assertIsNotNone(include_re.match("index.html"))
+        self.assertIsNotNone(include_re.match("work/a.html"))
+        self.assertIsNone(include_re.match("a.html/evil/deep.html"))
+        self.assertIsNone(include_re.match("work/a.html.tmp"))
+        self.assertIsNone(include_re.match("work/nested/a.html"))
+
+    def test_glob_character_class_negation(self):
+        from sanitize_templates import _translate_glob
+        import re as _re
+        negated = _re.compile(_translate_glob("[!abc]*.html") + r"\Z")
+        self.assertIsNone(negated.match("axe.html"))
+        self.assertIsNotNone(negated.match("zed.html"))
+        plain = _re.compile(_translate_glob("[abc]*.html") + r"\Z")
+        self.assertIsNotNone(plain.match("axe.html"))
+        self.assertIsNone(plain.match("zed.html"))
+        caret = _re.compile(_translate_glob("[^]x") + r"\Z")
+        self.assertIsNotNone(caret.match("^x"))
+
+    def test_report_location_and_dry_run(self):
+        backends = _available_backends()
+        if not backends:
+            self.skipTest("no parser backend installed")
+        with tempfile.TemporaryDirectory() as tmp:
+            root, config_path = self._make_export(tmp)
+            config = json.loads(config_path.read_text(encoding="utf-8"))
+            config["output"]["report"] = "sanitize-report.txt"
+            config_path.write_text(json.dumps(config), encoding="utf-8")
+
+            # A dry run writes no report (and changes no files).
+            before = (root / "index.html").read_text(encoding="utf-8")
+            TemplateSanitizer(config_path=config_path, parser=backends[0],
+                              dry_run=True, jobs=1).run()
+            self.assertEqual((root / "index.html").read_text(encoding="utf-8"),
+                             before)
+            self.assertFalse((root / "sanitize-report.txt").exists())
+            self.assertFalse(Path("sanitize-report.txt").exists())
+
+            # A real run resolves a bare report filename against the root.
+            TemplateSanitizer(config_path=config_path, parser=backends[0],
+                              jobs=1).run()
+            self.assertTrue((root / "sanitize-report.txt").exists())
+            self.assertFalse(Path("sanitize-report.txt").exists())
+
+    def test_at_least_one_backend_installed(self):
+        self.assertTrue(_available_backends(),
+                        "no parser backend installed; see scripts/requirements.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()